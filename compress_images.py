@@ -9,11 +9,22 @@ Usage:
 
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from PIL import Image, ImageOps
+from PIL import Image, ImageOps, features
 import shutil
 
-def compress_image(input_path, output_path, max_width=1200, quality=85, optimize=True):
+# libvips streams tiles through a fused decode→shrink→encode pipeline,
+# which is both faster and far lighter on memory than the Pillow path.
+# It is optional; without it we fall back to Pillow below. A pyvips wheel
+# without the libvips shared library raises OSError at import, not
+# ImportError, so catch both.
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+
+def compress_image(input_path, output_path, max_width=1200, quality=85, optimize=True, original_size=None):
     """
     Compress an image for web use.
     
@@ -23,46 +34,78 @@ def compress_image(input_path, output_path, max_width=1200, quality=85, optimize
         max_width: Maximum width in pixels (height will be scaled proportionally)
         quality: JPEG quality (85 is good balance of quality/size)
         optimize: Whether to optimize the image
+        original_size: Input file size in bytes, if the caller already has
+            it (saves a stat); looked up here otherwise
+
+    Returns:
+        Compressed size in bytes on success, False on failure
     """
     try:
         print(f"📸 Compressing: {input_path.name}")
-        
+
+        if original_size is None:
+            original_size = input_path.stat().st_size
+
+        if pyvips is not None:
+            return _compress_image_vips(input_path, output_path, max_width, quality, original_size)
+
         # Open and process image
         with Image.open(input_path) as img:
-            # Get original size
             original_width, original_height = img.size
-            original_size = input_path.stat().st_size
-            
+
             print(f"   Original: {original_width}x{original_height} ({original_size / 1024 / 1024:.1f} MB)")
-            
+
+            # Ask the decoder for a reduced-resolution decode where the codec
+            # supports it (JPEG DCT scaling); a no-op for PNG, but the same
+            # pipeline also handles JPEG-derived inputs.
+            if original_width > max_width:
+                img.draft('RGB', (max_width, (max_width * original_height) // original_width))
+
             # Convert to RGB if necessary (for JPEG output)
             if img.mode in ('RGBA', 'LA', 'P'):
-                # Create white background for transparency
-                background = Image.new('RGB', img.size, (255, 255, 255))
                 if img.mode == 'P':
-                    img = img.convert('RGBA')
-                background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                img = background
+                    # Palette without transparency maps straight to RGB
+                    if 'transparency' in img.info:
+                        img = img.convert('RGBA')
+                    else:
+                        img = img.convert('RGB')
+                if img.mode in ('RGBA', 'LA'):
+                    # Only blend onto white when some pixel is actually
+                    # translucent; scanned pages are almost always fully
+                    # opaque, and a plain convert skips the background
+                    # allocation and paste pass entirely
+                    if img.getextrema()[-1][0] == 255:
+                        img = img.convert('RGB')
+                    else:
+                        background = Image.new('RGB', img.size, (255, 255, 255))
+                        background.paste(img, mask=img.split()[-1])
+                        img = background
             elif img.mode != 'RGB':
                 img = img.convert('RGB')
-            
-            # Resize if image is too wide
+
+            # Auto-orient before the resize so the transpose (a full-image
+            # copy) never runs on top of freshly resized pixels; PNGs carry
+            # no EXIF, so the check skips the call entirely for them.
+            if 'exif' in img.info:
+                img = ImageOps.exif_transpose(img)
+
+            # Resize if image is too wide; thumbnail() keeps the aspect
+            # ratio, never upscales, resizes in place without an extra
+            # full-size copy, and runs Pillow's two-pass downsampling
+            # (cheap box shrink, then LANCZOS at reduced resolution)
             if original_width > max_width:
-                # Calculate new height maintaining aspect ratio
-                new_height = int((max_width * original_height) / original_width)
-                img = img.resize((max_width, new_height), Image.Resampling.LANCZOS)
-                print(f"   Resized to: {max_width}x{new_height}")
-            
-            # Auto-orient image
-            img = ImageOps.exif_transpose(img)
-            
+                img.thumbnail((max_width, 10**7), Image.Resampling.LANCZOS, reducing_gap=2.0)
+                print(f"   Resized to: {img.size[0]}x{img.size[1]}")
+
             # Save as optimized JPEG
             img.save(
                 output_path,
                 'JPEG',
                 quality=quality,
                 optimize=optimize,
-                progressive=True  # Progressive JPEG for better web loading
+                progressive=True,   # Progressive JPEG for better web loading
+                subsampling=2,      # 4:2:0 chroma subsampling, smaller files at same perceived quality
+                qtables='web_high'  # quant tables tuned for web delivery instead of the libjpeg defaults
             )
             
             # Get compressed size
@@ -71,13 +114,76 @@ def compress_image(input_path, output_path, max_width=1200, quality=85, optimize
             
             print(f"   Compressed: {img.size[0]}x{img.size[1]} ({compressed_size / 1024 / 1024:.1f} MB)")
             print(f"   Saved: {compression_ratio:.1f}% smaller")
-            
-            return True
-            
+
+            return compressed_size
+
     except Exception as e:
         print(f"❌ Error compressing {input_path.name}: {e}")
         return False
 
+def _compress_image_vips(input_path, output_path, max_width, quality, original_size):
+    """
+    Fast path for compress_image using libvips.
+
+    thumbnail() fuses decode, shrink-on-load and flattening into one
+    streamed pipeline, so the full-resolution image never sits in memory.
+    """
+    img = pyvips.Image.thumbnail(
+        str(input_path),
+        max_width,
+        height=10**7,      # effectively unconstrained; only width limits
+        size='down'        # never upscale smaller images
+    )
+
+    # Flatten transparency onto white, matching the Pillow path
+    if img.hasalpha():
+        img = img.flatten(background=[255, 255, 255])
+
+    print(f"   Original: ({original_size / 1024 / 1024:.1f} MB)")
+
+    img.jpegsave(
+        str(output_path),
+        Q=quality,
+        optimize_coding=True,
+        interlace=True,    # progressive JPEG
+        strip=True
+    )
+
+    compressed_size = output_path.stat().st_size
+    compression_ratio = (1 - compressed_size / original_size) * 100
+
+    print(f"   Compressed: {img.width}x{img.height} ({compressed_size / 1024 / 1024:.1f} MB)")
+    print(f"   Saved: {compression_ratio:.1f}% smaller")
+
+    return compressed_size
+
+def init_worker():
+    """
+    One-time per-process setup for the compression pool.
+
+    The scans are our own trusted multi-megapixel files, so lift Pillow's
+    decompression-bomb limit once per worker instead of letting every
+    Image.open run (and warn on) the pixel-count check.
+    """
+    Image.MAX_IMAGE_PIXELS = None
+
+def compress_image_worker(args):
+    """
+    Worker wrapper around compress_image for process pools.
+
+    Args:
+        args: Tuple of (input_path, output_path, original_size, max_width, quality)
+
+    Returns:
+        Tuple of (ok, original_size, compressed_size)
+    """
+    input_path, output_path, original_size, max_width, quality = args
+    compressed_size = compress_image(input_path, output_path, max_width, quality,
+                                     original_size=original_size)
+    if not compressed_size:
+        return False, original_size, 0
+    return True, original_size, compressed_size
+
 def main():
     """Main compression function."""
     print("🗜️  Image Compression Tool")
@@ -98,8 +204,14 @@ def main():
     print(f"📁 Output: {output_dir}")
     print()
     
-    # Get all PNG files
-    png_files = list(input_dir.glob("*.png"))
+    # Get all PNG files and their sizes in a single directory scan;
+    # scandir entries carry stat info for free, avoiding a stat per file
+    with os.scandir(input_dir) as entries:
+        png_files = [
+            (Path(entry.path), entry.stat().st_size)
+            for entry in entries
+            if entry.is_file() and entry.name.endswith('.png')
+        ]
     
     if not png_files:
         print("❌ No PNG files found in input directory!")
@@ -113,6 +225,13 @@ def main():
     QUALITY = 85      # Good balance of quality and file size
     
     print(f"⚙️  Settings: Max width = {MAX_WIDTH}px, Quality = {QUALITY}")
+
+    # Report which JPEG backend Pillow was built against; mozjpeg/libjpeg-turbo
+    # produce noticeably smaller files at the same quality than stock libjpeg.
+    if features.check_feature('libjpeg_turbo'):
+        print("⚙️  JPEG encoder: libjpeg-turbo/mozjpeg")
+    else:
+        print("⚠️  JPEG encoder: stock libjpeg (install a libjpeg-turbo/mozjpeg Pillow build for ~20% smaller files)")
     print()
     
     # Process each image
@@ -121,22 +240,20 @@ def main():
     total_original_size = 0
     total_compressed_size = 0
     
-    for png_file in sorted(png_files):
-        # Create output filename (change extension to .jpg)
-        output_file = output_dir / (png_file.stem + ".jpg")
-        
-        # Track sizes
-        original_size = png_file.stat().st_size
-        total_original_size += original_size
-        
-        # Compress
-        if compress_image(png_file, output_file, MAX_WIDTH, QUALITY):
-            successful += 1
-            total_compressed_size += output_file.stat().st_size
-        else:
-            failed += 1
-        
-        print()
+    # Each file is independent and CPU-bound, so fan out across all cores
+    jobs = [
+        (png_file, output_dir / (png_file.stem + ".jpg"), size, MAX_WIDTH, QUALITY)
+        for png_file, size in sorted(png_files)
+    ]
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=init_worker) as executor:
+        for ok, original_size, compressed_size in executor.map(compress_image_worker, jobs):
+            total_original_size += original_size
+            if ok:
+                successful += 1
+                total_compressed_size += compressed_size
+            else:
+                failed += 1
     
     # Summary
     print("=" * 50)
@@ -161,11 +278,17 @@ def main():
     if replace in ('y', 'yes'):
         print("🔄 Replacing original images...")
         
-        # Backup original directory
+        # Backup original directory. Hardlinks make this instant and free of
+        # extra disk space; fall back to a real copy if linking isn't
+        # supported (e.g. backup on a different filesystem).
         backup_dir = Path("individual_pages_backup")
         if backup_dir.exists():
             shutil.rmtree(backup_dir)
-        shutil.copytree(input_dir, backup_dir)
+        try:
+            shutil.copytree(input_dir, backup_dir, copy_function=os.link)
+        except OSError:
+            shutil.rmtree(backup_dir, ignore_errors=True)
+            shutil.copytree(input_dir, backup_dir)
         print(f"💾 Original images backed up to: {backup_dir}")
         
         # Replace files
@@ -177,9 +300,10 @@ def main():
             # Remove original PNG
             if target_path.exists():
                 target_path.unlink()
-            
-            # Copy compressed JPG as PNG (just rename extension)
-            shutil.copy2(jpg_file, target_path.with_suffix('.jpg'))
+
+            # Move compressed JPG into place; os.replace is an atomic rename,
+            # no data copy involved
+            os.replace(jpg_file, target_path.with_suffix('.jpg'))
             
         print("✅ Original images replaced with compressed versions!")
         print("⚠️  Note: Images are now JPEG format but may have .png extension")
@@ -9,6 +9,7 @@ It uses PyMuPDF (fitz) library for efficient PDF processing.
 import fitz  # PyMuPDF
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
@@ -27,82 +28,171 @@ def create_output_directory(pdf_path: str) -> str:
     return output_dir
 
 
+def extract_page_images(doc: "fitz.Document", page_num: int, output_dir: str) -> List[str]:
+    """
+    Extract all images from a single PDF page.
+
+    Args:
+        doc: Open fitz document
+        page_num: Zero-based page number
+        output_dir: Directory to save images to
+
+    Returns:
+        List of saved image paths
+    """
+    page = doc[page_num]
+    saved_files = []
+
+    # Get list of images on the page
+    image_list = page.get_images()
+
+    if image_list:
+        print(f"Page {page_num + 1}: Found {len(image_list)} image(s)")
+
+    # Extract each image
+    for img_index, img in enumerate(image_list):
+        # Get image data
+        xref = img[0]   # xref number
+        smask = img[1]  # soft-mask xref (0 if none)
+
+        # Fast path: if the embedded stream is already PNG and carries no
+        # soft mask, write its bytes verbatim — no decode, no zlib
+        # recompression through a Pixmap
+        if smask == 0:
+            info = doc.extract_image(xref)
+            if info and info["ext"] == "png":
+                if info["width"] < 10 or info["height"] < 10:
+                    print(f"  Skipping small image: {info['width']}x{info['height']}")
+                    continue
+
+                img_filename = f"page_{page_num + 1:03d}_img_{img_index + 1:03d}.png"
+                img_path = os.path.join(output_dir, img_filename)
+
+                with open(img_path, "wb") as fh:
+                    fh.write(info["image"])
+                saved_files.append(img_path)
+
+                print(f"  Saved: {img_filename} ({info['width']}x{info['height']})")
+                continue
+
+        pix = fitz.Pixmap(doc, xref)
+
+        # Skip if image is too small (likely decorative elements)
+        if pix.width < 10 or pix.height < 10:
+            print(f"  Skipping small image: {pix.width}x{pix.height}")
+            pix = None
+            continue
+
+        # Determine image format and extension
+        if pix.n - pix.alpha < 4:  # GRAY or RGB
+            img_ext = "png"
+        else:  # CMYK
+            # If the embedded stream is already a CMYK JPEG, dump its bytes
+            # verbatim: no decode, no re-encode, no generation loss
+            info = doc.extract_image(xref) if smask == 0 else None
+            if info and info["ext"] == "jpeg" and info["colorspace"] == 4:
+                img_filename = f"page_{page_num + 1:03d}_img_{img_index + 1:03d}.jpg"
+                img_path = os.path.join(output_dir, img_filename)
+
+                with open(img_path, "wb") as fh:
+                    fh.write(info["image"])
+                saved_files.append(img_path)
+
+                print(f"  Saved: {img_filename} ({pix.width}x{pix.height})")
+                pix = None
+                continue
+
+            # Anything else (e.g. lossless flate CMYK) converts to RGB and
+            # stays PNG so no quality is lost
+            pix = fitz.Pixmap(fitz.csRGB, pix)
+            img_ext = "png"
+
+        # Create filename
+        img_filename = f"page_{page_num + 1:03d}_img_{img_index + 1:03d}.{img_ext}"
+        img_path = os.path.join(output_dir, img_filename)
+
+        # Save image
+        pix.save(img_path)
+        saved_files.append(img_path)
+
+        print(f"  Saved: {img_filename} ({pix.width}x{pix.height})")
+
+        # Clean up
+        pix = None
+
+    return saved_files
+
+
+def extract_page_range_worker(args: Tuple[str, str, int, int]) -> List[str]:
+    """
+    Worker wrapper extracting images from a contiguous page range.
+
+    fitz documents cannot cross process boundaries, so each worker opens
+    the PDF itself and walks its assigned pages.
+
+    Args:
+        args: Tuple of (pdf_path, output_dir, start_page, end_page)
+
+    Returns:
+        List of saved image paths
+    """
+    pdf_path, output_dir, start_page, end_page = args
+    doc = fitz.open(pdf_path)
+    saved_files = []
+
+    for page_num in range(start_page, end_page):
+        saved_files.extend(extract_page_images(doc, page_num, output_dir))
+
+    doc.close()
+    return saved_files
+
+
 def extract_images_from_pdf(pdf_path: str) -> Tuple[int, List[str]]:
     """
     Extract all images from a PDF file.
-    
+
     Args:
         pdf_path: Path to the PDF file
-        
+
     Returns:
         Tuple of (total_images_extracted, list_of_saved_files)
     """
     if not os.path.exists(pdf_path):
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-    
+
     # Create output directory
     output_dir = create_output_directory(pdf_path)
-    
-    # Open PDF
+
+    # Open briefly just for the page count; workers open their own handles
     doc = fitz.open(pdf_path)
-    total_images = 0
-    saved_files = []
-    
+    page_count = len(doc)
+    doc.close()
+
     print(f"Processing PDF: {pdf_path}")
-    print(f"Total pages: {len(doc)}")
+    print(f"Total pages: {page_count}")
     print("-" * 50)
-    
-    # Iterate through each page
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        
-        # Get list of images on the page
-        image_list = page.get_images()
-        
-        if image_list:
-            print(f"Page {page_num + 1}: Found {len(image_list)} image(s)")
-        
-        # Extract each image
-        for img_index, img in enumerate(image_list):
-            # Get image data
-            xref = img[0]  # xref number
-            pix = fitz.Pixmap(doc, xref)
-            
-            # Skip if image is too small (likely decorative elements)
-            if pix.width < 10 or pix.height < 10:
-                print(f"  Skipping small image: {pix.width}x{pix.height}")
-                pix = None
-                continue
-            
-            # Determine image format and extension
-            if pix.n - pix.alpha < 4:  # GRAY or RGB
-                img_ext = "png"
-            else:  # CMYK: convert to RGB first
-                pix_rgb = fitz.Pixmap(fitz.csRGB, pix)
-                pix = pix_rgb
-                img_ext = "png"
-            
-            # Create filename
-            img_filename = f"page_{page_num + 1:03d}_img_{img_index + 1:03d}.{img_ext}"
-            img_path = os.path.join(output_dir, img_filename)
-            
-            # Save image
-            pix.save(img_path)
-            saved_files.append(img_path)
-            total_images += 1
-            
-            print(f"  Saved: {img_filename} ({pix.width}x{pix.height})")
-            
-            # Clean up
-            pix = None
-    
-    doc.close()
-    
+
+    # Carve the pages into one contiguous range per worker
+    workers = min(os.cpu_count() or 1, page_count) or 1
+    chunk = -(-page_count // workers)  # ceil division
+    ranges = [
+        (pdf_path, output_dir, start, min(start + chunk, page_count))
+        for start in range(0, page_count, chunk)
+    ]
+
+    saved_files = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for files in executor.map(extract_page_range_worker, ranges):
+            saved_files.extend(files)
+
+    saved_files.sort()
+    total_images = len(saved_files)
+
     print("-" * 50)
     print(f"Extraction complete!")
     print(f"Total images extracted: {total_images}")
     print(f"Images saved to: {output_dir}/")
-    
+
     return total_images, saved_files
 
 
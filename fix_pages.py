@@ -9,7 +9,6 @@ This script:
 """
 
 import os
-import shutil
 import sys
 
 def main():
@@ -48,41 +47,33 @@ def main():
         print("ℹ️ page_001.png not found, nothing to remove")
         return
     
-    # Create temporary directory for renaming
-    temp_dir = "temp_pages"
-    if os.path.exists(temp_dir):
-        shutil.rmtree(temp_dir)
-    os.makedirs(temp_dir)
-    
     print(f"\n🔄 Renaming pages to fix numbering...")
-    
-    # Copy cover page as-is
-    cover_src = os.path.join(pages_dir, "page_000_cover.png")
-    cover_dst = os.path.join(temp_dir, "page_000_cover.png")
-    if os.path.exists(cover_src):
-        shutil.copy2(cover_src, cover_dst)
+
+    # Cover page keeps its name and never moves
+    if os.path.exists(os.path.join(pages_dir, "page_000_cover.png")):
         print(f"✅ Kept cover: page_000_cover.png")
-    
-    # Rename all pages starting from page_002.png -> page_001.png
-    page_counter = 1
-    for i in range(2, 50):  # Check up to page_049
-        old_page = f"page_{i:03d}.png"
-        old_path = os.path.join(pages_dir, old_page)
-        
-        if os.path.exists(old_path):
-            new_page = f"page_{page_counter:03d}.png"
-            new_path = os.path.join(temp_dir, new_page)
-            
-            shutil.copy2(old_path, new_path)
-            print(f"✅ Renamed: {old_page} -> {new_page}")
-            page_counter += 1
-        else:
-            break  # No more pages
-    
-    # Replace original directory with fixed pages
-    print(f"\n🔄 Replacing original pages...")
-    shutil.rmtree(pages_dir)
-    shutil.move(temp_dir, pages_dir)
+
+    # One directory listing gives every remaining numbered page in order —
+    # no per-number exists() probing, and no hardcoded upper bound
+    numbered_pages = sorted(
+        f for f in os.listdir(pages_dir)
+        if f.endswith('.png') and f != 'page_000_cover.png'
+    )
+
+    # Renumber in place with a two-pass rename: first move every page to a
+    # temporary name so old and new numbers can never collide, then strip
+    # the temporary suffix. No staging directory, no data copied.
+    renames = []
+    for page_counter, old_page in enumerate(numbered_pages, start=1):
+        new_page = f"page_{page_counter:03d}.png"
+        tmp_path = os.path.join(pages_dir, new_page + ".tmp")
+
+        os.rename(os.path.join(pages_dir, old_page), tmp_path)
+        renames.append((tmp_path, old_page, new_page))
+
+    for tmp_path, old_page, new_page in renames:
+        os.rename(tmp_path, os.path.join(pages_dir, new_page))
+        print(f"✅ Renamed: {old_page} -> {new_page}")
     
     # List final pages
     final_pages = sorted([f for f in os.listdir(pages_dir) if f.endswith('.png')])
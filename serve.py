@@ -9,30 +9,123 @@ Usage:
 Then open: http://localhost:8000
 """
 
+import gzip
 import http.server
-import socketserver
+import shutil
 import webbrowser
 import os
 import sys
 
+# Text assets worth precompressing; images are already compressed
+COMPRESSIBLE = ('.html', '.css', '.js')
+
+def precompress_assets():
+    """Write .gz siblings for text assets so they can be served precompressed."""
+    for name in os.listdir('.'):
+        if not name.endswith(COMPRESSIBLE):
+            continue
+        gz_name = name + '.gz'
+        if os.path.exists(gz_name) and os.path.getmtime(gz_name) >= os.path.getmtime(name):
+            continue  # already up to date
+        with open(name, 'rb') as src, gzip.open(gz_name, 'wb', compresslevel=9) as dst:
+            shutil.copyfileobj(src, dst)
+        print(f"🗜️  Precompressed: {name} -> {gz_name}")
+
 def main():
     PORT = 8000
     
     # Change to the script's directory
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
-    
+
+    precompress_assets()
+
     Handler = http.server.SimpleHTTPRequestHandler
     
     # Add CORS headers to avoid any potential issues
     class CORSHTTPRequestHandler(Handler):
+        def send_response(self, code, message=None):
+            # Remember the status so end_headers can tell successful
+            # responses apart from errors
+            self._response_status = code
+            super().send_response(code, message)
+
         def end_headers(self):
             self.send_header('Access-Control-Allow-Origin', '*')
             self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
             self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+
+            base = self.path.split('?')[0]
+            if (base.startswith('/individual_pages_compressed/')
+                    and base.endswith(('.jpg', '.jpeg', '.png'))
+                    and 200 <= getattr(self, '_response_status', 0) < 300):
+                # Compressed output images only change when the pipeline
+                # reruns; let the browser cache them for good instead of
+                # re-downloading the whole book on every visit. Images
+                # elsewhere (individual_pages/, book_images/) are rewritten
+                # in place under the same names, so they get no cache
+                # header — and neither does any error response.
+                self.send_header('Cache-Control', 'public, max-age=31536000, immutable')
+            elif (base.endswith('.gz')
+                    and 200 <= getattr(self, '_response_status', 0) < 300):
+                # Only label actual .gz bodies; a 404 for a .gz URL sends a
+                # plain-HTML error page that must not claim to be gzip
+                self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Vary', 'Accept-Encoding')
+
             super().end_headers()
-    
+
+        def guess_type(self, path):
+            # Report the original type for precompressed variants
+            if path.endswith('.gz'):
+                return super().guess_type(path[:-3])
+            return super().guess_type(path)
+
+        def do_GET(self):
+            # Serve the precompressed sibling when the client accepts gzip
+            base = self.path.split('?')[0]
+            if base.endswith('/'):
+                base += 'index.html'
+            if (base.endswith(COMPRESSIBLE)
+                    and 'gzip' in self.headers.get('Accept-Encoding', '')
+                    and os.path.exists(self.translate_path(base) + '.gz')):
+                self.path = base + '.gz'
+            super().do_GET()
+
+        def copyfile(self, source, outputfile):
+            # Zero-copy path for the big page images: hand the open file
+            # to the kernel with sendfile() instead of shuttling chunks
+            # through Python buffers
+            try:
+                in_fd = source.fileno()
+            except (AttributeError, OSError):
+                return super().copyfile(source, outputfile)
+
+            if outputfile is not self.wfile or not hasattr(os, 'sendfile'):
+                return super().copyfile(source, outputfile)
+
+            sent = 0
+            try:
+                out_fd = self.connection.fileno()
+                size = os.fstat(in_fd).st_size
+                self.wfile.flush()  # headers must go out before the body
+
+                while sent < size:
+                    sent += os.sendfile(out_fd, in_fd, sent, size - sent)
+            except OSError:
+                # Once any body bytes are on the wire, a retry through the
+                # buffered copy would append duplicate data; propagate the
+                # error like the base handler's own write path does
+                if sent:
+                    raise
+                # Nothing sent yet: sendfile is unsupported on this
+                # socket/filesystem, use the buffered copy instead
+                source.seek(0)
+                super().copyfile(source, outputfile)
+
     try:
-        with socketserver.TCPServer(("", PORT), CORSHTTPRequestHandler) as httpd:
+        # ThreadingHTTPServer handles each request on its own thread, so one
+        # slow image download no longer blocks the rest of the page load
+        with http.server.ThreadingHTTPServer(("", PORT), CORSHTTPRequestHandler) as httpd:
             print(f"🚀 Starting server at http://localhost:{PORT}")
             print(f"📁 Serving files from: {os.getcwd()}")
             print(f"📚 Open http://localhost:{PORT} in your browser")
@@ -7,18 +7,25 @@ to create individual page images that Turn.js can use properly.
 """
 
 from PIL import Image
+from concurrent.futures import ProcessPoolExecutor
 import os
 import sys
 
-def split_spread_image(input_path, output_dir, page_number):
+# Web output settings for the fused --jpeg mode (kept in sync with
+# compress_images.py)
+JPEG_MAX_WIDTH = 1200
+JPEG_QUALITY = 85
+
+def split_spread_image(input_path, output_dir, page_number, to_jpeg=False):
     """
     Split a spread image into left and right pages.
-    
+
     Args:
         input_path: Path to the spread image
         output_dir: Directory to save split pages
         page_number: The spread number (1-based)
-    
+        to_jpeg: Save web-ready JPEGs directly instead of PNG intermediates
+
     Returns:
         Tuple of (left_page_path, right_page_path)
     """
@@ -31,51 +38,95 @@ def split_spread_image(input_path, output_dir, page_number):
             
             # Calculate split point (middle of image)
             split_x = width // 2
-            
-            # Split into left and right halves
-            left_half = img.crop((0, 0, split_x, height))
-            right_half = img.crop((split_x, 0, width, height))
-            
-            # Generate output filenames
+
+            # Crop boxes for the two halves
+            left_box = (0, 0, split_x, height)
+            right_box = (split_x, 0, width, height)
+
+            ext = "jpg" if to_jpeg else "png"
+
+            # Generate output filenames and map each half to its target
             if page_number == 1:
-                # First spread: cover (right) and first content page (left)
-                left_path = os.path.join(output_dir, "page_000_cover.png")  # Cover
-                right_path = os.path.join(output_dir, "page_001.png")      # Page 1
-                
-                # For cover, we want the right half (actual cover)
-                # For page 1, we want the left half (first content page)
-                right_half.save(left_path, 'PNG', optimize=True)
-                left_half.save(right_path, 'PNG', optimize=True)
-                
-                print(f"  ✅ Cover saved: {left_path}")
-                print(f"  ✅ Page 1 saved: {right_path}")
-                
-                return left_path, right_path
+                # First spread: cover (right half) and first content page (left half)
+                left_path = os.path.join(output_dir, f"page_000_cover.{ext}")  # Cover
+                right_path = os.path.join(output_dir, f"page_001.{ext}")      # Page 1
+
+                targets = [
+                    (right_box, left_path, "Cover"),
+                    (left_box, right_path, "Page 1"),
+                ]
             else:
                 # Regular spreads: calculate page numbers
                 left_page_num = (page_number - 1) * 2
                 right_page_num = left_page_num + 1
-                
-                left_path = os.path.join(output_dir, f"page_{left_page_num:03d}.png")
-                right_path = os.path.join(output_dir, f"page_{right_page_num:03d}.png")
-                
-                # Save left and right pages
-                left_half.save(left_path, 'PNG', optimize=True)
-                right_half.save(right_path, 'PNG', optimize=True)
-                
-                print(f"  ✅ Page {left_page_num} saved: {left_path}")
-                print(f"  ✅ Page {right_page_num} saved: {right_path}")
-                
-                return left_path, right_path
+
+                left_path = os.path.join(output_dir, f"page_{left_page_num:03d}.{ext}")
+                right_path = os.path.join(output_dir, f"page_{right_page_num:03d}.{ext}")
+
+                targets = [
+                    (left_box, left_path, f"Page {left_page_num}"),
+                    (right_box, right_path, f"Page {right_page_num}"),
+                ]
+
+            # Crop and save one half at a time: each half's buffer is
+            # allocated by crop() and freed before the next half is
+            # touched, so peak memory holds the spread plus one half
+            # instead of the spread plus both.
+            # These pages are intermediates (compress_images.py re-encodes
+            # them to JPEG), so use the fastest zlib level instead of
+            # optimize=True's exhaustive filter/compression search.
+            for box, path, label in targets:
+                half = img.crop(box)
+                if to_jpeg:
+                    # Fused mode: resize and encode the web-ready JPEG here,
+                    # skipping the PNG intermediate entirely
+                    if half.mode != 'RGB':
+                        half = half.convert('RGB')
+                    if half.width > JPEG_MAX_WIDTH:
+                        new_height = int((JPEG_MAX_WIDTH * half.height) / half.width)
+                        half = half.resize((JPEG_MAX_WIDTH, new_height),
+                                           Image.Resampling.LANCZOS, reducing_gap=2.0)
+                    half.save(path, 'JPEG', quality=JPEG_QUALITY, optimize=True,
+                              progressive=True, subsampling=2, qtables='web_high')
+                else:
+                    half.save(path, 'PNG', compress_level=1)
+                print(f"  ✅ {label} saved: {path}")
+
+            return left_path, right_path
                 
     except Exception as e:
         print(f"❌ Error processing spread {page_number}: {e}")
         raise
 
+def split_spread_worker(args):
+    """
+    Worker wrapper around split_spread_image for process pools.
+
+    Args:
+        args: Tuple of (input_path, output_dir, page_number, to_jpeg)
+
+    Returns:
+        Number of pages created (2 on success, 0 on failure)
+    """
+    input_path, output_dir, page_number, to_jpeg = args
+    try:
+        split_spread_image(input_path, output_dir, page_number, to_jpeg)
+        return 2
+    except Exception as e:
+        print(f"❌ Failed to process spread {page_number}: {e}")
+        return 0
+
 def main():
     """Main function to split all spread images."""
     print("🔄 Starting page splitting process...")
-    
+
+    # --jpeg fuses splitting and web compression into one pipeline:
+    # spreads go straight to resized progressive JPEGs, so there are no
+    # PNG intermediates to re-read and re-encode afterwards
+    to_jpeg = '--jpeg' in sys.argv[1:]
+    if to_jpeg:
+        print("⚙️  Fused mode: writing web-ready JPEGs directly")
+
     # Create output directory for individual pages
     output_dir = "individual_pages"
     if not os.path.exists(output_dir):
@@ -86,20 +137,21 @@ def main():
     total_spreads = 11
     total_pages_created = 0
     
+    # Each spread is independent (decode + two crops + two PNG encodes),
+    # so split them in parallel across all cores
+    jobs = []
     for i in range(1, total_spreads + 1):
         input_path = f"book_images/page_{i:03d}_img_001.png"
-        
+
         if not os.path.exists(input_path):
             print(f"⚠️ Warning: Spread image not found: {input_path}")
             continue
-            
-        try:
-            left_path, right_path = split_spread_image(input_path, output_dir, i)
-            total_pages_created += 2
-            
-        except Exception as e:
-            print(f"❌ Failed to process spread {i}: {e}")
-            continue
+
+        jobs.append((input_path, output_dir, i, to_jpeg))
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for pages_created in executor.map(split_spread_worker, jobs):
+            total_pages_created += pages_created
     
     print("\n" + "="*50)
     print(f"🎉 Page splitting completed!")
@@ -110,7 +162,7 @@ def main():
     
     # List all created pages
     if os.path.exists(output_dir):
-        pages = sorted([f for f in os.listdir(output_dir) if f.endswith('.png')])
+        pages = sorted([f for f in os.listdir(output_dir) if f.endswith(('.png', '.jpg'))])
         print(f"\n📋 Created pages:")
         for page in pages:
             file_path = os.path.join(output_dir, page)